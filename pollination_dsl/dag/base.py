@@ -4,6 +4,7 @@ import warnings
 
 from queenbee.recipe.dag import DAG as QBDAG
 from ..common import _BaseClass
+from .inputs import inputs_to_queenbee
 
 
 @dataclass
@@ -50,7 +51,7 @@ class DAG(_BaseClass):
             inputs_dict[id(method)] = method_name.replace('_', '-')
 
         tasks = []
-        inputs = []
+        named_inputs = []
         outputs = []
 
         for method_name, method in inspect.getmembers(cls):
@@ -63,12 +64,14 @@ class DAG(_BaseClass):
                     method.to_queenbee(method, method(cls), inputs_dict, self._package)
                 )
             elif qb_dec == 'input':
-                inputs.append(method.to_queenbee(name=method_name))
+                named_inputs.append((method_name, method))
             elif qb_dec == 'output':
                 outputs.append(method.to_queenbee(name=method_name))
             else:
                 raise ValueError(f'Unsupported __decorator__: {qb_dec}')
 
+        inputs = inputs_to_queenbee(named_inputs)
+
         self._cached_queenbee = QBDAG(
             name=name, inputs=inputs, tasks=tasks, outputs=outputs
         )
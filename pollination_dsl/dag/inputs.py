@@ -1,6 +1,7 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, ClassVar, Dict, List, Optional
 from dataclasses import dataclass
-from pydantic import field_validator
+from functools import lru_cache
+from pydantic import PrivateAttr
 from queenbee.io.inputs.dag import (
     DAGGenericInput, DAGStringInput, DAGIntegerInput, DAGNumberInput,
     DAGBooleanInput, DAGFolderInput, DAGFileInput, DAGPathInput,
@@ -12,7 +13,7 @@ from queenbee.io.common import ItemType
 from ..alias.inputs import InputAliasTypes
 
 
-__all__ = ('Inputs', )
+__all__ = ('Inputs', 'inputs_to_queenbee')
 
 _inputs_mapper = {
     'GenericInput': DAGGenericInput,
@@ -28,27 +29,36 @@ _inputs_mapper = {
 }
 
 
+@lru_cache(maxsize=1024)
+def _dash_name(name: str) -> str:
+    """Convert a Python input name to a Queenbee input name."""
+    return name.replace('_', '-')
+
+
 class _InputBase(BaseModel):
 
     description: str = None
     default: Any = None
     default_local: Any = None
     spec: Dict = None
-    alias: Optional[List[InputAliasTypes]] = Field(
-        default=None,
-        validate_default=True
-    )
+    alias: Optional[List[InputAliasTypes]] = Field(default_factory=list)
     optional: bool = False
 
-    @field_validator('alias', mode='before')
-    @classmethod
-    def empty_list_alias(cls, v):
-        return v if v is not None else []
+    # queenbee inputs are cached by name. The cache is cleared when a field is set
+    # and is not carried over to copies of the input.
+    _qb_cache: Dict = PrivateAttr(default_factory=dict)
+    _qb_alias: List = PrivateAttr(default=None)
 
-    @property
-    def __decorator__(self) -> str:
-        """Queenbee decorator for inputs."""
-        return 'input'
+    # queenbee class for each input type. These are set once after the classes are
+    # created using _inputs_mapper.
+    _qb_class: ClassVar[type] = None
+    _has_extensions: ClassVar[bool] = False
+    _has_items_type: ClassVar[bool] = False
+
+    # Queenbee decorator for inputs.
+    __decorator__: ClassVar[str] = 'input'
+    is_artifact: ClassVar[bool] = False
+    reference_type: ClassVar[str] = 'InputReference'
 
     @property
     def required(self):
@@ -59,39 +69,70 @@ class _InputBase(BaseModel):
         else:
             return True
 
-    def to_queenbee(self, name):
-        """Convert this input to a Queenbee input."""
-        func = _inputs_mapper[self.__class__.__name__]
+    def _clear_cache(self):
+        """Remove the cached Queenbee objects for this input."""
+        self._qb_cache = {}
+        self._qb_alias = None
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in self.__class__.model_fields:
+            self._clear_cache()
+
+    def __copy__(self):
+        copied = super().__copy__()
+        copied._clear_cache()
+        return copied
 
-        annotations = self.annotations or {}
+    def __deepcopy__(self, memo=None):
+        copied = super().__deepcopy__(memo)
+        copied._clear_cache()
+        return copied
+
+    def to_queenbee(self, name):
+        """Convert this input to a Queenbee input.
+
+        The result is cached by name and the same object is returned on the next call.
+        DAGs that share an input, for instance a DAG and its subclass, also share the
+        Queenbee input. Copy the returned object before changing it.
+        """
+        cached = self._qb_cache.get(name)
+        if cached is not None:
+            return cached
+
+        func = self._qb_class
+
+        # aliases are cached as dictionaries so each validation creates new alias objects
+        if self._qb_alias is None:
+            self._qb_alias = [
+                al.to_queenbee().model_dump() for al in self.alias or []
+            ]
+
+        # reuse the input annotations unless default_local needs to be added. The
+        # annotations are copied in that case to keep the input itself unchanged.
+        annotations = self.annotations if self.annotations is not None else {}
         if self.default_local:
-            annotations['__default_local__'] = self.default_local
+            annotations = {**annotations, '__default_local__': self.default_local}
 
         data = {
             'required': self.required,
-            'name': name.replace('_', '-'),
+            'name': _dash_name(name),
             'default': self.default,
             'description': self.description,
             'annotations': annotations,
             'spec': self.spec,
-            'alias': [al.to_queenbee().model_dump() for al in self.alias]
+            'alias': self._qb_alias
         }
 
-        if hasattr(self, 'extensions'):
+        if self._has_extensions:
             data['extensions'] = self.extensions
 
-        if hasattr(self, 'items_type'):
+        if self._has_items_type:
             data['items_type'] = self.items_type
 
-        return func.model_validate(data)
-
-    @property
-    def is_artifact(self):
-        return False
-
-    @property
-    def reference_type(self):
-        return 'InputReference'
+        qb_input = func.model_validate(data)
+        self._qb_cache[name] = qb_input
+        return qb_input
 
 
 class GenericInput(_InputBase):
@@ -219,6 +260,8 @@ class ListInput(StringInput):
         'the same type.'
     )
 
+    _has_items_type: ClassVar[bool] = True
+
 
 class FolderInput(StringInput):
     """ A DAG folder input.
@@ -233,13 +276,8 @@ class FolderInput(StringInput):
         alias: A list of aliases for this input in different platforms.
 
     """
-    @property
-    def is_artifact(self):
-        return True
-
-    @property
-    def reference_type(self):
-        return 'InputFolderReference'
+    is_artifact: ClassVar[bool] = True
+    reference_type: ClassVar[str] = 'InputFolderReference'
 
 
 class FileInput(FolderInput):
@@ -258,9 +296,9 @@ class FileInput(FolderInput):
     """
     extensions: Optional[List[str]] = None
 
-    @property
-    def reference_type(self):
-        return 'InputFileReference'
+    _has_extensions: ClassVar[bool] = True
+
+    reference_type: ClassVar[str] = 'InputFileReference'
 
 
 class PathInput(FileInput):
@@ -278,9 +316,24 @@ class PathInput(FileInput):
 
     """
 
-    @property
-    def reference_type(self):
-        return 'InputPathReference'
+    reference_type: ClassVar[str] = 'InputPathReference'
+
+
+for _cls_name, _qb_cls in _inputs_mapper.items():
+    globals()[_cls_name]._qb_class = _qb_cls
+del _cls_name, _qb_cls
+
+
+def inputs_to_queenbee(named_inputs) -> List:
+    """Convert several DAG inputs to Queenbee inputs.
+
+    Args:
+        named_inputs: An iterable of (name, input) tuples.
+
+    Returns:
+        A list of Queenbee inputs in the same order as named_inputs.
+    """
+    return [inp.to_queenbee(name) for name, inp in named_inputs]
 
 
 @dataclass
@@ -9,3 +9,14 @@ def test_local_default():
     inp_qb = inp.to_queenbee('test_input')
     assert inp_qb.default == 10
     assert inp_qb.annotations['__default_local__'] == 20
+
+
+def test_local_default_annotations():
+    inp = IntegerInput(
+        default=10,
+        default_local=20,
+        annotations={'key': 'value'}
+    )
+    inp_qb = inp.to_queenbee('test_input')
+    assert inp_qb.annotations == {'key': 'value', '__default_local__': 20}
+    assert inp.annotations == {'key': 'value'}
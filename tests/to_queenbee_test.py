@@ -0,0 +1,96 @@
+from dataclasses import dataclass
+
+from pollination_dsl.alias.inputs import Inputs as AliasInputs
+from pollination_dsl.dag import DAG, Inputs
+from pollination_dsl.dag.inputs import IntegerInput, inputs_to_queenbee
+
+
+@dataclass
+class SampleDAG(DAG):
+    """A DAG with inputs only."""
+
+    b_input = Inputs.int(default=10)
+    a_input = Inputs.str(default='value', default_local='local value')
+
+
+def test_to_queenbee_cache():
+    inp = IntegerInput(default=10)
+    inp_qb = inp.to_queenbee('test_input')
+    assert inp.to_queenbee('test_input') is inp_qb
+    assert inp.to_queenbee('other_input') is not inp_qb
+    assert inp.to_queenbee('other_input').name == 'other-input'
+
+
+def test_inputs_to_queenbee():
+    inputs_qb = inputs_to_queenbee(
+        [('b_input', IntegerInput(default=10)), ('a_input', IntegerInput(default=5))]
+    )
+    assert [inp.name for inp in inputs_qb] == ['b-input', 'a-input']
+    assert inputs_qb[1].default == 5
+
+
+def test_dag_inputs():
+    dag_inputs = SampleDAG().queenbee.inputs
+    # inspect.getmembers returns the inputs sorted by name
+    assert [inp.name for inp in dag_inputs] == ['a-input', 'b-input']
+    assert dag_inputs[0].type == 'DAGStringInput'
+    assert dag_inputs[0].default == 'value'
+    assert dag_inputs[0].annotations['__default_local__'] == 'local value'
+    assert dag_inputs[1].type == 'DAGIntegerInput'
+    assert dag_inputs[1].default == 10
+
+
+def test_required_model_copy():
+    inp = IntegerInput()
+    assert inp.required is True
+    assert inp.model_copy(update={'default': 7}).required is False
+
+
+def test_to_queenbee_cache_model_copy():
+    inp = IntegerInput()
+    assert inp.to_queenbee('test_input').default is None
+    copied = inp.model_copy(update={'default': 7})
+    copied_qb = copied.to_queenbee('test_input')
+    assert copied_qb.default == 7
+    assert copied_qb.required is False
+    assert inp.to_queenbee('test_input').default is None
+
+
+def test_to_queenbee_cache_set_field():
+    inp = IntegerInput()
+    assert inp.to_queenbee('test_input').default is None
+    inp.default = 7
+    assert inp.to_queenbee('test_input').default == 7
+
+
+def test_to_queenbee_alias_model_copy():
+    inp = Inputs.str(default='value')
+    assert inp.to_queenbee('test_input').alias == []
+    alias = [AliasInputs.str(name='alias-input', platform=['grasshopper'])]
+    copied = inp.model_copy(update={'alias': alias})
+    assert [al.name for al in copied.to_queenbee('test_input').alias] == ['alias-input']
+    assert inp.to_queenbee('test_input').alias == []
+
+
+def test_to_queenbee_alias_none():
+    inp = Inputs.str(default='value', alias=None)
+    assert inp.to_queenbee('test_input').alias == []
+
+
+def test_to_queenbee_file_not_shared():
+    alias = [AliasInputs.str(name='alias-input', platform=['grasshopper'])]
+    inp = Inputs.file(extensions=['epw'], annotations={'key': 'value'}, alias=alias)
+    inp_qb = inp.to_queenbee('weather_file')
+    assert inp_qb.type == 'DAGFileInput'
+    assert inp_qb.required is True
+    assert inp_qb.extensions == ['epw']
+
+    # the queenbee input does not share mutable values with the DSL input
+    inp_qb.annotations['other'] = 'value'
+    inp_qb.extensions.append('wea')
+    assert inp.annotations == {'key': 'value'}
+    assert inp.extensions == ['epw']
+    other_qb = inp.to_queenbee('other_file')
+    assert inp_qb.alias is not other_qb.alias
+    assert inp_qb.alias[0] is not other_qb.alias[0]
+    assert inp_qb.alias[0] == other_qb.alias[0]